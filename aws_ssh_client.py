@@ -6,11 +6,24 @@ Connects to AWS instance and performs directory operations
 
 import paramiko
 import os
+import re
+import shlex
+import shutil
+import stat
 import sys
+import tarfile
+import time
 import argparse
+import heapq
+import operator
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -20,9 +33,198 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Local write buffer and per-read chunk size used when streaming downloads to disk
+SFTP_READ_BUFFER_SIZE = 1024 * 1024
+SFTP_READ_CHUNK_SIZE = 256 * 1024
+# Machine-readable directory listing used when SFTP is unavailable:
+# mode, links, owner, group, size in bytes, mtime and name, tab-separated with
+# each entry NUL-terminated so any character but NUL is safe in a name
+FIND_LISTING_COMMAND = (
+    "find -H {path} -mindepth 1 -maxdepth 1 -not -name '.*' "
+    r"-printf '%M\t%n\t%u\t%g\t%s\t%T@\t%f\0'"
+)
+# Bytes pulled from a command's channel per recv call
+CHANNEL_RECV_SIZE = 65536
+# Seconds a directory listing is reused before it is fetched again
+LISTING_CACHE_TTL = 5.0
+# Seconds between keepalive packets so idle pooled connections survive
+# NAT/firewall timeouts
+SSH_KEEPALIVE_INTERVAL = 30
+# Environment sent with every remote command: the C locale skips locale
+# processing and keeps command output stable for parsing
+COMMAND_ENVIRONMENT = {'LANG': 'C', 'LC_ALL': 'C'}
+# Upper bound on commands run concurrently over one SSH transport
+MAX_CONCURRENT_COMMANDS = 8
+
+# System information probes, run together as one script by get_system_info.
+# Each output is tagged with its key and exit code so it can be split apart again.
+_SYSINFO_CMDS = (
+    ('hostname', 'hostname'),
+    ('uptime', 'uptime'),
+    ('disk_usage', 'df -h /'),
+    ('memory', 'free -h'),
+    ('cpu_info', 'lscpu | head -10'),
+    ('current_dir', 'pwd'),
+    ('user', 'whoami'),
+)
+_SYSINFO_SCRIPT = "; ".join(
+    f'echo "<<<{key}>>>"; {{ {command}; }} 2>&1; echo "<<<$?>>>"'
+    for key, command in _SYSINFO_CMDS
+)
+_SYSINFO_OUTPUT_RE = re.compile(r'<<<(\w+)>>>\n(.*?)<<<(\d+)>>>', re.DOTALL)
+
+# Resource probes shown at the end of main
+_RESOURCE_CMDS = (
+    ("💾 Disk Usage", "df -h / 2>/dev/null | tail -1"),
+    ("🧠 Memory Usage", "free -h 2>/dev/null | grep Mem"),
+    ("⚡ Load Average", "uptime 2>/dev/null | cut -d',' -f3-"),
+    ("🔄 Running Processes",
+     "ps aux --sort=-%cpu | head -5 2>/dev/null || ps aux | head -5"),
+)
+
+# Live SSH connections shared by every AWSSSHClient,
+# keyed by (host, user, key, port, compress)
+_CONNECTION_POOL: Dict[Tuple[str, str, str, int, bool], paramiko.SSHClient] = {}
+_POOL_LOCK = threading.Lock()
+# Per-key locks so a slow handshake only holds up callers for the same connection
+_CONNECT_LOCKS: Dict[Tuple[str, str, str, int, bool], threading.Lock] = {}
+
+
+@lru_cache(maxsize=8)
+def _load_private_key(key_path: str) -> paramiko.PKey:
+    """
+    Load a private key once and reuse it across reconnects
+
+    The key type (RSA, Ed25519, ECDSA) is detected from the file itself.
+
+    Args:
+        key_path: Expanded path to SSH private key
+
+    Returns:
+        paramiko.PKey: Parsed private key
+    """
+    return paramiko.PKey.from_path(key_path)
+
+
+def _get_connection(
+    hostname: str, username: str, key_path: str, port: int, compress: bool = False
+) -> paramiko.SSHClient:
+    """
+    Return a pooled SSH connection, opening a new one if none is alive
+
+    Args:
+        hostname: AWS instance IP or hostname
+        username: SSH username
+        key_path: Path to SSH private key
+        port: SSH port
+        compress: Negotiate zlib compression for the whole transport
+
+    Returns:
+        paramiko.SSHClient: Connected client with an active transport
+    """
+    pool_key = (hostname, username, key_path, port, compress)
+    with _POOL_LOCK:
+        connect_lock = _CONNECT_LOCKS.setdefault(pool_key, threading.Lock())
+
+    with connect_lock:
+        with _POOL_LOCK:
+            client = _CONNECTION_POOL.get(pool_key)
+        if client:
+            transport = client.get_transport()
+            if transport and transport.is_active():
+                logger.debug(f"Reusing pooled connection to {hostname}")
+                return client
+            # Connection went away, drop it and reconnect
+            client.close()
+            with _POOL_LOCK:
+                _CONNECTION_POOL.pop(pool_key, None)
+
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+        logger.info(f"Connecting to {hostname}...")
+        try:
+            client.connect(
+                hostname=hostname,
+                port=port,
+                username=username,
+                pkey=_load_private_key(key_path),
+                timeout=30,
+                compress=compress
+            )
+            client.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
+        except Exception:
+            client.close()
+            raise
+
+        with _POOL_LOCK:
+            _CONNECTION_POOL[pool_key] = client
+        return client
+
+
+@atexit.register
+def close_pooled_connections() -> None:
+    """Close every pooled SSH connection"""
+    with _POOL_LOCK:
+        for client in _CONNECTION_POOL.values():
+            client.close()
+        _CONNECTION_POOL.clear()
+
+
+def _drain_stderr(channel: paramiko.Channel) -> Tuple[threading.Thread, bytearray]:
+    """
+    Read a channel's stderr on a background thread until EOF
+
+    Unread stderr still uses up the channel window shared with stdout, so it
+    has to be consumed while the caller reads stdout.
+
+    Args:
+        channel: Channel of a running command
+
+    Returns:
+        tuple: Reader thread to join and the buffer it fills
+    """
+    buf = bytearray()
+
+    def drain() -> None:
+        while chunk := channel.recv_stderr(CHANNEL_RECV_SIZE):
+            buf.extend(chunk)
+
+    thread = threading.Thread(target=drain, daemon=True)
+    thread.start()
+    return thread, buf
+
+
+def _skip_unsafe_members(
+    member: tarfile.TarInfo, dest_path: str
+) -> Optional[tarfile.TarInfo]:
+    """
+    Apply tarfile's 'data' filter, skipping members it rejects
+
+    Absolute symlinks and similar entries are common on real hosts; dropping
+    them keeps the rest of the archive extracting instead of aborting it.
+    """
+    try:
+        return tarfile.data_filter(member, dest_path)
+    except tarfile.FilterError as e:
+        logger.warning(f"Skipping {member.name}: {str(e)}")
+        return None
+
+
+_SIZE_UNITS = ('bytes', 'KB', 'MB', 'GB')
+
+
+def _humanize(n: int) -> str:
+    """Format a byte count, picking the unit from its bit length"""
+    idx = min(3, max(0, (n.bit_length() - 1) // 10))
+    if idx == 0:
+        return f"{n} bytes"
+    return f"{n / (1 << (idx * 10)):.1f}{_SIZE_UNITS[idx]}"
+
 
 class AWSSSHClient:
-    def __init__(self, hostname: str, username: str, key_path: str, port: int = 22):
+    def __init__(self, hostname: str, username: str, key_path: str, port: int = 22,
+                 compress: bool = False):
         """
         Initialize SSH client for AWS connection
 
@@ -31,13 +233,21 @@ class AWSSSHClient:
             username: SSH username
             key_path: Path to SSH private key
             port: SSH port (default 22)
+            compress: Enable SSH compression (default False). It shrinks text
+                command output on slow links, but also runs every SFTP
+                download and tar stream through Python-side zlib, which caps
+                throughput on fast links and gains nothing on binary or
+                already-compressed data.
         """
         self.hostname = hostname
         self.username = username
         self.key_path = Path(key_path).expanduser()
         self.port = port
+        self.compress = compress
         self.client = None
         self.sftp = None
+        # Recent directory listings keyed by path: (fetched at, entries)
+        self._listing_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
 
     def __enter__(self):
         """Context manager entry"""
@@ -58,29 +268,33 @@ class AWSSSHClient:
             bool: True if connection successful, False otherwise
         """
         try:
-            # Create SSH client
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            # Nothing to do if we're still attached to a live connection
+            if self.client:
+                transport = self.client.get_transport()
+                if transport and transport.is_active():
+                    return True
 
             # Load private key
             if not self.key_path.exists():
                 logger.error(f"SSH key not found: {self.key_path}")
                 return False
 
-            private_key = paramiko.RSAKey.from_private_key_file(str(self.key_path))
-
-            # Connect
-            logger.info(f"Connecting to {self.hostname}...")
-            self.client.connect(
-                hostname=self.hostname,
-                port=self.port,
-                username=self.username,
-                pkey=private_key,
-                timeout=30
+            # Reuse the pooled connection; new channels share its transport
+            self.client = _get_connection(
+                self.hostname, self.username, str(self.key_path), self.port,
+                self.compress
             )
 
             # Create SFTP client for file operations
-            self.sftp = self.client.open_sftp()
+            try:
+                self.sftp = self.client.open_sftp()
+            except paramiko.SSHException as e:
+                # Some hardened hosts disable the SFTP subsystem;
+                # shell commands still work
+                logger.warning(
+                    f"SFTP unavailable, falling back to shell commands: {str(e)}"
+                )
+                self.sftp = None
             logger.info("Successfully connected to AWS instance")
             return True
 
@@ -88,6 +302,18 @@ class AWSSSHClient:
             logger.error(f"Failed to connect: {str(e)}")
             return False
 
+    def close(self) -> None:
+        """
+        Close the SFTP session and release the pooled connection
+
+        The underlying SSH connection stays open for reuse by other clients
+        and is closed at interpreter exit.
+        """
+        if self.sftp:
+            self.sftp.close()
+            self.sftp = None
+        self.client = None
+
     def execute_command(self, command: str) -> Dict[str, Any]:
         """
         Execute command on remote server
@@ -103,11 +329,21 @@ class AWSSSHClient:
 
         try:
             logger.info(f"Executing: {command}")
-            stdin, stdout, stderr = self.client.exec_command(command)
-
-            exit_code = stdout.channel.recv_exit_status()
-            stdout_data = stdout.read().decode('utf-8')
-            stderr_data = stderr.read().decode('utf-8')
+            stdin, stdout, stderr = self._exec_command(command)
+            channel = stdout.channel
+
+            # Drain the channel directly in large chunks and decode once at the end.
+            # Both streams are read before waiting on the exit status so a command
+            # with lots of output can't stall on a full channel window.
+            stderr_thread, stderr_buf = _drain_stderr(channel)
+            stdout_buf = bytearray()
+            while chunk := channel.recv(CHANNEL_RECV_SIZE):
+                stdout_buf += chunk
+            stderr_thread.join()
+
+            exit_code = channel.recv_exit_status()
+            stdout_data = stdout_buf.decode('utf-8', 'replace')
+            stderr_data = stderr_buf.decode('utf-8', 'replace')
 
             return {
                 'stdout': stdout_data,
@@ -118,6 +354,14 @@ class AWSSSHClient:
             logger.error(f"Command execution failed: {str(e)}")
             return {'stdout': '', 'stderr': str(e), 'exit_code': -1}
 
+    def _exec_command(self, command: str) -> Tuple[Any, Any, Any]:
+        """Run command under a plain /bin/sh with the C locale and no PTY"""
+        return self.client.exec_command(
+            f"/bin/sh -c {shlex.quote(command)}",
+            get_pty=False,
+            environment=COMMAND_ENVIRONMENT
+        )
+
     def list_directory(self, path: str = '/') -> List[Dict[str, Any]]:
         """
         List directory contents with detailed information
@@ -126,45 +370,105 @@ class AWSSSHClient:
             path: Directory path to list
 
         Returns:
-            list: List of file/directory information
+            list: List of file/directory information. `month`, `day` and `time`
+                are rendered from the entry's mtime in this machine's local
+                timezone, not the server's as `ls` would show them.
         """
+        cached = self._listing_cache.get(path)
+        if cached and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+            # Hand out a copy so callers can't reorder or trim the cached entry
+            return list(cached[1])
+
         try:
-            # Execute ls -lrth command
-            result = self.execute_command(f"ls -lrth {path}")
-
-            if result['exit_code'] != 0:
-                logger.error(f"Failed to list directory: {result['stderr']}")
-                return []
-
-            files = []
-            lines = result['stdout'].strip().split('\n')
-
-            # Skip the total line if present
-            if lines and lines[0].startswith('total'):
-                lines = lines[1:]
-
-            for line in lines:
-                if line.strip():
-                    parts = line.split()
-                    if len(parts) >= 9:
-                        file_info = {
-                            'permissions': parts[0],
-                            'links': parts[1],
-                            'owner': parts[2],
-                            'group': parts[3],
-                            'size': parts[4],
-                            'month': parts[5],
-                            'day': parts[6],
-                            'time': parts[7],
-                            'name': ' '.join(parts[8:])
-                        }
-                        files.append(file_info)
-
-            return files
+            if self.sftp:
+                files = self._list_directory_sftp(path)
+            else:
+                files = self._list_directory_shell(path)
+
+            # Mirror `ls -lrt`: list oldest entries first
+            files.sort(key=lambda f: f['mtime'])
+            self._listing_cache[path] = (time.monotonic(), files)
+            return list(files)
         except Exception as e:
             logger.error(f"Failed to list directory: {str(e)}")
             return []
 
+    def _list_directory_sftp(self, path: str) -> List[Dict[str, Any]]:
+        """List directory contents using SFTP attributes"""
+        files = []
+        for attr in self.sftp.listdir_attr(path):
+            # Hide dotfiles like `ls` does
+            if attr.filename.startswith('.'):
+                continue
+            links, owner, group = self._longname_fields(attr)
+            files.append(self._make_file_info(
+                permissions=stat.filemode(attr.st_mode or 0),
+                links=links,
+                owner=owner,
+                group=group,
+                size=attr.st_size or 0,
+                mtime=attr.st_mtime or 0,
+                name=attr.filename
+            ))
+        return files
+
+    @staticmethod
+    def _longname_fields(attr: paramiko.SFTPAttributes) -> Tuple[str, str, str]:
+        """
+        Get link count, owner and group names for an SFTP directory entry
+
+        OpenSSH fills `longname` with the `ls -l` line for the entry, whose second
+        to fourth fields hold these; without it fall back to numeric ids and an
+        unknown ('?') link count.
+        """
+        parts = (getattr(attr, 'longname', None) or '').split(None, 4)
+        if len(parts) >= 4:
+            return parts[1], parts[2], parts[3]
+        return '?', str(attr.st_uid), str(attr.st_gid)
+
+    def _list_directory_shell(self, path: str) -> List[Dict[str, Any]]:
+        """List directory contents using `find -printf` for hosts without SFTP"""
+        command = FIND_LISTING_COMMAND.format(path=shlex.quote(path))
+        result = self.execute_command(command)
+
+        if result['exit_code'] != 0:
+            raise Exception(result['stderr'].strip())
+
+        files = []
+        for line in filter(None, result['stdout'].split('\0')):
+            parts = line.split('\t', 6)
+            if len(parts) == 7:
+                files.append(self._make_file_info(
+                    permissions=parts[0],
+                    links=parts[1],
+                    owner=parts[2],
+                    group=parts[3],
+                    size=int(parts[4]),
+                    mtime=float(parts[5]),
+                    name=parts[6]
+                ))
+
+        return files
+
+    @staticmethod
+    def _make_file_info(permissions: str, links: str, owner: str, group: str,
+                        size: int, mtime: float, name: str) -> Dict[str, Any]:
+        """Build a directory entry in the format returned by list_directory"""
+        # Local time of this machine; SFTP and find only give us the epoch
+        modified = datetime.fromtimestamp(mtime)
+        return {
+            'permissions': permissions,
+            'links': links,
+            'owner': owner,
+            'group': group,
+            'size': size,
+            'mtime': mtime,
+            'month': modified.strftime('%b'),
+            'day': str(modified.day),
+            'time': modified.strftime('%H:%M'),
+            'name': name
+        }
+
     def get_file_content(self, remote_path: str) -> Optional[str]:
         """
         Read file content from remote server
@@ -175,6 +479,12 @@ class AWSSSHClient:
         Returns:
             str: File content or None if failed
         """
+        if not self.sftp:
+            logger.error(
+                f"Failed to read file {remote_path}: SFTP subsystem unavailable"
+            )
+            return None
+
         try:
             with self.sftp.open(remote_path, 'r') as file:
                 content = file.read()
@@ -194,9 +504,25 @@ class AWSSSHClient:
         Returns:
             bool: True if successful, False otherwise
         """
+        if not self.sftp:
+            logger.error("Download failed: SFTP subsystem unavailable")
+            return False
+
         try:
             logger.info(f"Downloading {remote_path} to {local_path}")
-            self.sftp.get(remote_path, local_path)
+            with self.sftp.open(remote_path, 'rb') as src, \
+                    open(local_path, 'wb', buffering=SFTP_READ_BUFFER_SIZE) as dst:
+                # Queue concurrent read requests for the whole file up front
+                remote_size = src.stat().st_size
+                src.prefetch(remote_size)
+                shutil.copyfileobj(src, dst, SFTP_READ_CHUNK_SIZE)
+
+            local_size = os.path.getsize(local_path)
+            if local_size != remote_size:
+                logger.error(
+                    f"Download failed: size mismatch {local_size} != {remote_size}"
+                )
+                return False
             logger.info("Download completed")
             return True
         except Exception as e:
@@ -214,15 +540,81 @@ class AWSSSHClient:
         Returns:
             bool: True if successful, False otherwise
         """
+        if not self.sftp:
+            logger.error("Upload failed: SFTP subsystem unavailable")
+            return False
+
         try:
             logger.info(f"Uploading {local_path} to {remote_path}")
+            # put() pipelines its writes and stat()s the result to confirm the size
             self.sftp.put(local_path, remote_path)
+            # Cached listings may now be stale
+            self._listing_cache.clear()
             logger.info("Upload completed")
             return True
         except Exception as e:
             logger.error(f"Upload failed: {str(e)}")
             return False
 
+    def download_directory(self, remote_path: str, local_dir: str) -> bool:
+        """
+        Download a whole directory as a single tar stream
+
+        Args:
+            remote_path: Directory path on remote server
+            local_dir: Local directory to extract into
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self.client:
+            raise Exception("Not connected to server")
+
+        logger.info(f"Downloading directory {remote_path} to {local_dir}")
+        channel = None
+        stderr_thread = None
+        stderr_buf = bytearray()
+        exit_code = -1
+        error = None
+
+        try:
+            Path(local_dir).mkdir(parents=True, exist_ok=True)
+
+            # One channel carrying every file beats one SFTP round-trip per file
+            stdin, stdout, stderr = self._exec_command(
+                f"tar cf - -C {shlex.quote(remote_path)} ."
+            )
+            channel = stdout.channel
+            stderr_thread, stderr_buf = _drain_stderr(channel)
+            with tarfile.open(fileobj=stdout, mode='r|') as archive:
+                archive.extractall(local_dir, filter=_skip_unsafe_members)
+
+            # Consume tar's trailing padding so it can exit on its own
+            while channel.recv(CHANNEL_RECV_SIZE):
+                pass
+            exit_code = channel.recv_exit_status()
+        except Exception as e:
+            error = str(e)
+        finally:
+            # Closing the channel stops a remote tar we bailed out on and
+            # unblocks the stderr reader
+            if channel:
+                channel.close()
+            if stderr_thread:
+                stderr_thread.join()
+
+        if error is not None and channel:
+            # Returns straight away now the channel is closed; -1 if tar never reported
+            exit_code = channel.recv_exit_status()
+        if error is None and exit_code == 0:
+            logger.info("Directory download completed")
+            return True
+
+        # tar's own message (e.g. a missing directory) beats tarfile's "empty file"
+        details = stderr_buf.decode('utf-8', 'replace').strip() or error
+        logger.error(f"Directory download failed (exit code {exit_code}): {details}")
+        return False
+
     def change_directory(self, path: str) -> bool:
         """
         Change current directory on remote server
@@ -234,7 +626,7 @@ class AWSSSHClient:
             bool: True if successful, False otherwise
         """
         try:
-            result = self.execute_command(f"cd {path} && pwd")
+            result = self.execute_command(f"cd {shlex.quote(path)} && pwd")
             if result['exit_code'] == 0:
                 logger.info(f"Changed directory to: {result['stdout'].strip()}")
                 return True
@@ -252,25 +644,21 @@ class AWSSSHClient:
         Returns:
             dict: System information
         """
-        info = {}
-        commands = {
-            'hostname': 'hostname',
-            'uptime': 'uptime',
-            'disk_usage': 'df -h /',
-            'memory': 'free -h',
-            'cpu_info': 'lscpu | head -10',
-            'current_dir': 'pwd',
-            'user': 'whoami'
-        }
-
-        for key, command in commands.items():
-            result = self.execute_command(command)
-            if result['exit_code'] == 0:
-                info[key] = result['stdout'].strip()
+        # One exec for every probe instead of one round-trip each
+        result = self.execute_command(_SYSINFO_SCRIPT)
+
+        outputs = {}
+        for match in _SYSINFO_OUTPUT_RE.finditer(result['stdout']):
+            key, output, exit_code = match.groups()
+            if exit_code == '0':
+                outputs[key] = output.strip()
             else:
-                info[key] = f"Error: {result['stderr']}"
+                outputs[key] = f"Error: {output.strip()}"
 
-        return info
+        return {
+            key: outputs.get(key, f"Error: {result['stderr']}")
+            for key, _ in _SYSINFO_CMDS
+        }
 
     def get_directory_summary(self, path: str) -> Dict[str, Any]:
         """
@@ -291,31 +679,7 @@ class AWSSSHClient:
             total_dirs = len([f for f in files if f['permissions'].startswith('d')])
             total_regular_files = total_files - total_dirs
 
-            # Calculate total size (only for files with numeric sizes)
-            total_size = 0
-            size_unit = "bytes"
-            for file_info in files:
-                size_str = file_info['size']
-                if size_str.replace('.', '').isdigit():
-                    # Handle sizes like "1.2K", "3.4M", etc.
-                    if size_str.endswith('K'):
-                        total_size += float(size_str[:-1]) * 1024
-                    elif size_str.endswith('M'):
-                        total_size += float(size_str[:-1]) * 1024 * 1024
-                    elif size_str.endswith('G'):
-                        total_size += float(size_str[:-1]) * 1024 * 1024 * 1024
-                    else:
-                        total_size += float(size_str)
-
-            # Convert to human readable format
-            if total_size > 1024 * 1024 * 1024:
-                total_size = f"{total_size / (1024 * 1024 * 1024):.1f}GB"
-            elif total_size > 1024 * 1024:
-                total_size = f"{total_size / (1024 * 1024):.1f}MB"
-            elif total_size > 1024:
-                total_size = f"{total_size / 1024:.1f}KB"
-            else:
-                total_size = f"{int(total_size)} bytes"
+            total_size = sum(f['size'] for f in files)
 
             return {
                 "path": path,
@@ -323,26 +687,14 @@ class AWSSSHClient:
                 "total_items": total_files,
                 "directories": total_dirs,
                 "files": total_regular_files,
-                "total_size": total_size,
-                "largest_files": sorted(files, key=lambda x: self._parse_size(x['size']), reverse=True)[:3]
+                "total_size": _humanize(total_size),
+                "largest_files": heapq.nlargest(
+                    3, files, key=operator.itemgetter('size')
+                )
             }
         except Exception as e:
             return {"path": path, "accessible": False, "error": str(e)}
 
-    def _parse_size(self, size_str: str) -> float:
-        """Parse size string to bytes for sorting"""
-        if not size_str or not size_str.replace('.', '').replace('K', '').replace('M', '').replace('G', '').isdigit():
-            return 0
-
-        if size_str.endswith('K'):
-            return float(size_str[:-1]) * 1024
-        elif size_str.endswith('M'):
-            return float(size_str[:-1]) * 1024 * 1024
-        elif size_str.endswith('G'):
-            return float(size_str[:-1]) * 1024 * 1024 * 1024
-        else:
-            return float(size_str) if size_str.replace('.', '').isdigit() else 0
-
 
 def get_ssh_config():
     """Get SSH configuration from .env file, command line args, or prompt for missing values"""
@@ -362,6 +714,7 @@ Configuration priority (highest to lowest):
   AWS_SSH_USER     - SSH username (default: forge)
   AWS_SSH_KEY      - Path to SSH private key
   AWS_SSH_PORT     - SSH port (default: 22)
+  AWS_SSH_COMPRESS - Enable SSH compression: true/false (default: false)
 
 Examples:
   python aws_ssh_client.py                    # Use .env file + prompts
@@ -395,6 +748,13 @@ Examples:
         default=None
     )
 
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Enable SSH compression (helps text output on slow links, "
+             "slows bulk transfers on fast ones)"
+    )
+
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -412,6 +772,9 @@ Examples:
     user = args.user or os.getenv("AWS_SSH_USER", "forge")
     key = args.key or os.getenv("AWS_SSH_KEY")
     port = args.port or int(os.getenv("AWS_SSH_PORT", "22"))
+    compress = args.compress or os.getenv("AWS_SSH_COMPRESS", "").lower() in [
+        '1', 'true', 'yes'
+    ]
 
     # Check for required values and prompt if missing
     if not host:
@@ -452,13 +815,14 @@ Examples:
 
     # Create a simple config object
     class Config:
-        def __init__(self, host, user, key, port):
+        def __init__(self, host, user, key, port, compress):
             self.host = host
             self.user = user
             self.key = key
             self.port = port
+            self.compress = compress
 
-    return Config(host, user, key, port)
+    return Config(host, user, key, port, compress)
 
 
 def main():
@@ -472,7 +836,9 @@ def main():
     print("-" * 50)
 
     # Create SSH client
-    ssh_client = AWSSSHClient(config.host, config.user, config.key, config.port)
+    ssh_client = AWSSSHClient(config.host, config.user, config.key, config.port,
+                              config.compress)
+    executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_COMMANDS)
 
     try:
         # Connect to server
@@ -480,9 +846,20 @@ def main():
             logger.error("Failed to establish connection")
             sys.exit(1)
 
+        # The exec-based probes don't depend on each other or on the SFTP
+        # listings below, so start them all now; each runs on its own channel
+        # of the shared transport
+        system_info_future = executor.submit(ssh_client.get_system_info)
+        docker_future = executor.submit(
+            ssh_client.execute_command,
+            "docker ps 2>/dev/null || echo 'Docker not available'"
+        )
+        resource_futures = {desc: executor.submit(ssh_client.execute_command, cmd)
+                            for desc, cmd in _RESOURCE_CMDS}
+
         # Get system information
         print("\n=== System Information ===")
-        system_info = ssh_client.get_system_info()
+        system_info = system_info_future.result()
         for key, value in system_info.items():
             print(f"{key.upper()}: {value}")
 
@@ -490,16 +867,18 @@ def main():
         print("\n=== Home Directory Contents ===")
         home_files = ssh_client.list_directory("/home/forge")
         for file_info in home_files:
-            print(f"{file_info['permissions']} {file_info['owner']} {file_info['group']} "
-                  f"{file_info['size']} {file_info['month']} {file_info['day']} "
+            print(f"{file_info['permissions']} {file_info['owner']} "
+                  f"{file_info['group']} {_humanize(file_info['size'])} "
+                  f"{file_info['month']} {file_info['day']} "
                   f"{file_info['time']} {file_info['name']}")
 
         # List root directory
         print("\n=== Root Directory Contents ===")
         root_files = ssh_client.list_directory("/")
         for file_info in root_files[:10]:  # Show first 10 items
-            print(f"{file_info['permissions']} {file_info['owner']} {file_info['group']} "
-                  f"{file_info['size']} {file_info['month']} {file_info['day']} "
+            print(f"{file_info['permissions']} {file_info['owner']} "
+                  f"{file_info['group']} {_humanize(file_info['size'])} "
+                  f"{file_info['month']} {file_info['day']} "
                   f"{file_info['time']} {file_info['name']}")
 
         # Check specific directories from .env configuration
@@ -527,7 +906,8 @@ def main():
                 if summary['largest_files']:
                     print("📊 Largest files:")
                     for file_info in summary['largest_files']:
-                        print(f"   {file_info['name']} ({file_info['size']})")
+                        size = _humanize(file_info['size'])
+                        print(f"   {file_info['name']} ({size})")
 
                 # Show first few items for detailed view
                 dir_contents = ssh_client.list_directory(directory)
@@ -535,14 +915,17 @@ def main():
                     print(f"📋 Recent items (showing first 5):")
                     for file_info in dir_contents[:5]:
                         file_type = "📂" if file_info['permissions'].startswith('d') else "📄"
+                        size = _humanize(file_info['size'])
                         print(
-                            f"   {file_type} {file_info['name']} - {file_info['size']} ({file_info['month']} {file_info['day']} {file_info['time']})")
+                            f"   {file_type} {file_info['name']} - {size} "
+                            f"({file_info['month']} {file_info['day']} "
+                            f"{file_info['time']})")
             else:
                 print(f"❌ {summary['error']}")
 
         # Example: Execute custom commands
         print("\n=== Docker Containers (if running) ===")
-        docker_result = ssh_client.execute_command("docker ps 2>/dev/null || echo 'Docker not available'")
+        docker_result = docker_future.result()
         if docker_result['exit_code'] == 0 and 'CONTAINER ID' in docker_result['stdout']:
             print("🐳 Running Docker containers:")
             print(docker_result['stdout'])
@@ -551,15 +934,8 @@ def main():
 
         # Show system resources
         print("\n=== System Resources ===")
-        resource_commands = {
-            "💾 Disk Usage": "df -h / 2>/dev/null | tail -1",
-            "🧠 Memory Usage": "free -h 2>/dev/null | grep Mem",
-            "⚡ Load Average": "uptime 2>/dev/null | cut -d',' -f3-",
-            "🔄 Running Processes": "ps aux --sort=-%cpu | head -5 2>/dev/null || ps aux | head -5"
-        }
-
-        for desc, cmd in resource_commands.items():
-            result = ssh_client.execute_command(cmd)
+        for desc, future in resource_futures.items():
+            result = future.result()
             if result['exit_code'] == 0 and result['stdout'].strip():
                 print(f"{desc}: {result['stdout'].strip()}")
             else:
@@ -571,10 +947,15 @@ def main():
         logger.error(f"Unexpected error: {str(e)}")
         logger.debug("Full traceback:", exc_info=True)
     finally:
-        # Always close the connection safely
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        # Always close the connection safely. Closing the pooled transports also
+        # unblocks any probe still waiting on its channel (e.g. after Ctrl-C), so
+        # its worker thread doesn't keep the interpreter alive on exit.
         try:
             if 'ssh_client' in locals():
                 ssh_client.close()
+            close_pooled_connections()
         except Exception as e:
             logger.debug(f"Error during cleanup: {e}")
             pass  # Don't fail on cleanup errors
@@ -0,0 +1,407 @@
+"""Tests for the output parsers in aws_ssh_client that don't need a server"""
+
+import io
+import logging
+import tarfile
+import threading
+from types import SimpleNamespace
+
+import paramiko
+import pytest
+
+import aws_ssh_client
+from aws_ssh_client import AWSSSHClient, _humanize
+
+
+@pytest.fixture
+def client():
+    return AWSSSHClient("example.com", "forge", "~/.ssh/missing-key")
+
+
+def fake_result(stdout="", stderr="", exit_code=0):
+    return {'stdout': stdout, 'stderr': stderr, 'exit_code': exit_code}
+
+
+class FakeChannel:
+    """Minimal stand-in for a paramiko Channel running a finished command"""
+
+    def __init__(self, stdout=b"", stderr=b"", exit_code=0):
+        self.stdout = io.BytesIO(stdout)
+        self.stderr = io.BytesIO(stderr)
+        self.exit_code = exit_code
+        self.closed = False
+
+    def recv(self, nbytes):
+        return self.stdout.read(nbytes)
+
+    def recv_stderr(self, nbytes):
+        return self.stderr.read(nbytes)
+
+    def recv_exit_status(self):
+        return self.exit_code
+
+    def close(self):
+        self.closed = True
+
+
+class FakeChannelFile:
+    """File-like stdout of a FakeChannel, as returned by exec_command"""
+
+    def __init__(self, channel):
+        self.channel = channel
+
+    def read(self, size=-1):
+        return self.channel.stdout.read(size)
+
+
+def make_tar(members):
+    """Build an uncompressed tar archive from (TarInfo, data) pairs"""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode='w') as archive:
+        for info, data in members:
+            archive.addfile(info, io.BytesIO(data) if data is not None else None)
+    return buf.getvalue()
+
+
+def file_member(name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    return info, data
+
+
+def connect_fake_channel(client, monkeypatch, channel):
+    commands = []
+
+    def exec_command(command):
+        commands.append(command)
+        return None, FakeChannelFile(channel), None
+
+    client.client = object()
+    monkeypatch.setattr(client, "_exec_command", exec_command)
+    return commands
+
+
+@pytest.mark.parametrize("n, expected", [
+    (0, "0 bytes"),
+    (1, "1 bytes"),
+    (1023, "1023 bytes"),
+    (1024, "1.0KB"),
+    (1536, "1.5KB"),
+    (1024 * 1024, "1.0MB"),
+    (1024 * 1024 * 1024, "1.0GB"),
+    (5 * 1024 ** 4, "5120.0GB"),
+])
+def test_humanize_unit_boundaries(n, expected):
+    assert _humanize(n) == expected
+
+
+def test_get_system_info_splits_batched_output(client, monkeypatch):
+    stdout = (
+        "<<<hostname>>>\nip-10-0-0-1\n<<<0>>>\n"
+        "<<<uptime>>>\nuptime: not found\n<<<127>>>\n"
+        "<<<disk_usage>>>\n<<<0>>>\n"
+        "<<<memory>>>\n              total\nMem:   7.7Gi\n<<<0>>>\n"
+        "<<<cpu_info>>>\nArchitecture: x86_64<<<0>>>\n"
+        "<<<current_dir>>>\n/home/forge\n<<<0>>>\n"
+    )
+    commands = []
+
+    def execute_command(command):
+        commands.append(command)
+        return fake_result(stdout=stdout, stderr="connection reset", exit_code=-1)
+
+    monkeypatch.setattr(client, "execute_command", execute_command)
+    info = client.get_system_info()
+
+    assert commands == [aws_ssh_client._SYSINFO_SCRIPT]
+    assert list(info) == [key for key, _ in aws_ssh_client._SYSINFO_CMDS]
+    assert info['hostname'] == "ip-10-0-0-1"
+    assert info['uptime'] == "Error: uptime: not found"
+    assert info['disk_usage'] == ""
+    assert info['memory'] == "total\nMem:   7.7Gi"
+    assert info['cpu_info'] == "Architecture: x86_64"
+    assert info['current_dir'] == "/home/forge"
+    # Probe cut off before its markers were printed
+    assert info['user'] == "Error: connection reset"
+
+
+def test_get_system_info_reports_failed_exec(client, monkeypatch):
+    monkeypatch.setattr(client, "execute_command",
+                        lambda command: fake_result(stderr="boom", exit_code=-1))
+
+    info = client.get_system_info()
+
+    assert set(info.values()) == {"Error: boom"}
+
+
+def test_list_directory_shell_parses_find_output(client, monkeypatch):
+    stdout = (
+        "drwxr-xr-x\t3\tforge\tforge\t4096\t1700000000.5\tlogs\0"
+        "\0"
+        "-rw-r--r--\t1\troot\tadm\t1253\t1690000000.0\tmy notes.txt\0"
+        "-rw-r--r--\t2\troot\troot\t7\t1690000001.0\ttab\tname\0"
+        "-rw-r--r--\t1\troot\troot\t9\t1690000002.0\tline\nsep\u2028name\0"
+        "garbage line\0"
+    )
+    commands = []
+
+    def execute_command(command):
+        commands.append(command)
+        return fake_result(stdout=stdout)
+
+    monkeypatch.setattr(client, "execute_command", execute_command)
+    files = client._list_directory_shell("/var/my logs")
+
+    assert "find -H '/var/my logs' " in commands[0]
+    assert [f['name'] for f in files] == [
+        "logs", "my notes.txt", "tab\tname", "line\nsep\u2028name"
+    ]
+    assert files[0]['permissions'] == "drwxr-xr-x"
+    assert (files[1]['owner'], files[1]['group']) == ("root", "adm")
+    assert files[1]['size'] == 1253
+    assert files[0]['mtime'] == 1700000000.5
+    assert [f['links'] for f in files] == ["3", "1", "2", "1"]
+
+
+def test_list_directory_shell_raises_on_failure(client, monkeypatch):
+    monkeypatch.setattr(
+        client, "execute_command",
+        lambda command: fake_result(stderr="find: '/nope': No such file\n", exit_code=1)
+    )
+
+    with pytest.raises(Exception, match="No such file"):
+        client._list_directory_shell("/nope")
+
+
+def test_longname_fields():
+    attr = paramiko.SFTPAttributes()
+    attr.st_uid, attr.st_gid = 1000, 33
+    attr.longname = "-rw-r--r--    2 forge    www-data     1253 Oct 14 10:20 a b.txt"
+
+    assert AWSSSHClient._longname_fields(attr) == ("2", "forge", "www-data")
+
+
+def test_longname_fields_fall_back_to_ids():
+    attr = paramiko.SFTPAttributes()
+    attr.st_uid, attr.st_gid = 1000, 33
+
+    assert AWSSSHClient._longname_fields(attr) == ("?", "1000", "33")
+
+
+def test_download_directory_extracts_tar_stream(client, monkeypatch, tmp_path):
+    channel = FakeChannel(stdout=make_tar([
+        file_member("./app.log", b"started\n"),
+        file_member("./conf/settings.ini", b"[main]\n"),
+    ]))
+    commands = connect_fake_channel(client, monkeypatch, channel)
+
+    assert client.download_directory("/opt/my app", str(tmp_path / "out"))
+
+    assert commands == ["tar cf - -C '/opt/my app' ."]
+    assert (tmp_path / "out" / "app.log").read_bytes() == b"started\n"
+    assert (tmp_path / "out" / "conf" / "settings.ini").read_bytes() == b"[main]\n"
+    assert channel.closed
+
+
+def test_download_directory_reports_tar_error(client, monkeypatch, tmp_path, caplog):
+    channel = FakeChannel(
+        stderr=b"tar: /nope: Cannot open: No such file or directory\n", exit_code=2
+    )
+    connect_fake_channel(client, monkeypatch, channel)
+
+    with caplog.at_level(logging.ERROR):
+        assert not client.download_directory("/nope", str(tmp_path / "out"))
+
+    assert "exit code 2" in caplog.text
+    assert "No such file or directory" in caplog.text
+    assert channel.closed
+
+
+def test_download_directory_skips_rejected_members(client, monkeypatch, tmp_path,
+                                                   caplog):
+    link = tarfile.TarInfo("./passwd-link")
+    link.type = tarfile.SYMTYPE
+    link.linkname = "/etc/passwd"
+    channel = FakeChannel(stdout=make_tar([
+        (link, None),
+        file_member("./after.txt", b"still here"),
+    ]))
+    connect_fake_channel(client, monkeypatch, channel)
+
+    with caplog.at_level(logging.WARNING):
+        assert client.download_directory("/home/forge", str(tmp_path / "out"))
+
+    assert not (tmp_path / "out" / "passwd-link").is_symlink()
+    assert (tmp_path / "out" / "after.txt").read_bytes() == b"still here"
+    assert "Skipping ./passwd-link" in caplog.text
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active = True
+        self.keepalive = None
+
+    def is_active(self):
+        return self.active
+
+    def set_keepalive(self, interval):
+        self.keepalive = interval
+
+
+class FakeSSHClient:
+    """Records connect/close calls in place of paramiko.SSHClient"""
+
+    instances = []
+    fail_hosts = set()
+    slow_hosts = {}
+
+    def __init__(self):
+        self.transport = None
+        self.closed = False
+        FakeSSHClient.instances.append(self)
+
+    def set_missing_host_key_policy(self, policy):
+        pass
+
+    def connect(self, hostname, **kwargs):
+        if hostname in self.slow_hosts:
+            self.slow_hosts[hostname].wait(5)
+        if hostname in self.fail_hosts:
+            raise paramiko.SSHException("handshake failed")
+        self.transport = FakeTransport()
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+        if self.transport:
+            self.transport.active = False
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    monkeypatch.setattr(FakeSSHClient, "instances", [])
+    monkeypatch.setattr(FakeSSHClient, "fail_hosts", set())
+    monkeypatch.setattr(FakeSSHClient, "slow_hosts", {})
+    monkeypatch.setattr(aws_ssh_client.paramiko, "SSHClient", FakeSSHClient)
+    monkeypatch.setattr(aws_ssh_client, "_load_private_key", lambda path: "key")
+    monkeypatch.setattr(aws_ssh_client, "_CONNECTION_POOL", {})
+    monkeypatch.setattr(aws_ssh_client, "_CONNECT_LOCKS", {})
+    return FakeSSHClient
+
+
+def test_get_connection_reuses_live_connection(fake_pool):
+    first = aws_ssh_client._get_connection("host", "forge", "/key", 22)
+    second = aws_ssh_client._get_connection("host", "forge", "/key", 22)
+
+    assert first is second
+    assert len(fake_pool.instances) == 1
+    assert first.transport.keepalive == aws_ssh_client.SSH_KEEPALIVE_INTERVAL
+
+
+def test_get_connection_replaces_dead_transport(fake_pool):
+    first = aws_ssh_client._get_connection("host", "forge", "/key", 22)
+    first.transport.active = False
+
+    second = aws_ssh_client._get_connection("host", "forge", "/key", 22)
+
+    assert second is not first
+    assert first.closed
+    pool_key = ("host", "forge", "/key", 22, False)
+    assert aws_ssh_client._CONNECTION_POOL[pool_key] is second
+
+
+def test_get_connection_closes_client_on_failure(fake_pool):
+    fake_pool.fail_hosts.add("down")
+
+    with pytest.raises(paramiko.SSHException):
+        aws_ssh_client._get_connection("down", "forge", "/key", 22)
+
+    assert fake_pool.instances[0].closed
+    assert aws_ssh_client._CONNECTION_POOL == {}
+
+
+def test_slow_connect_does_not_block_other_hosts(fake_pool):
+    release = threading.Event()
+    fake_pool.slow_hosts["slow"] = release
+    slow = threading.Thread(
+        target=aws_ssh_client._get_connection, args=("slow", "forge", "/key", 22)
+    )
+    slow.start()
+    try:
+        fast = threading.Thread(
+            target=aws_ssh_client._get_connection, args=("fast", "forge", "/key", 22)
+        )
+        fast.start()
+        fast.join(2)
+        assert not fast.is_alive()
+    finally:
+        release.set()
+        slow.join()
+
+
+@pytest.fixture
+def counted_listing(client, monkeypatch):
+    """Serve listings from a fake backend, with a controllable clock"""
+    clock = SimpleNamespace(now=100.0)
+    calls = []
+
+    def list_directory_shell(path):
+        calls.append(path)
+        return [
+            client._make_file_info("-rw-r--r--", "1", "forge", "forge", 10, 2.0, "new"),
+            client._make_file_info("-rw-r--r--", "1", "forge", "forge", 20, 1.0, "old"),
+        ]
+
+    monkeypatch.setattr(aws_ssh_client, "time",
+                        SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(client, "_list_directory_shell", list_directory_shell)
+    return clock, calls
+
+
+def test_list_directory_cache_hit_within_ttl(client, counted_listing):
+    clock, calls = counted_listing
+
+    first = client.list_directory("/var/log")
+    clock.now += aws_ssh_client.LISTING_CACHE_TTL - 0.1
+    second = client.list_directory("/var/log")
+
+    assert calls == ["/var/log"]
+    assert [f['name'] for f in second] == ["old", "new"]
+    assert second == first
+
+
+def test_list_directory_cache_expires(client, counted_listing):
+    clock, calls = counted_listing
+
+    client.list_directory("/var/log")
+    clock.now += aws_ssh_client.LISTING_CACHE_TTL
+    client.list_directory("/var/log")
+
+    assert calls == ["/var/log", "/var/log"]
+
+
+def test_list_directory_returns_copies(client, counted_listing):
+    clock, calls = counted_listing
+
+    client.list_directory("/var/log").clear()
+    hit = client.list_directory("/var/log")
+    hit.reverse()
+
+    assert [f['name'] for f in client.list_directory("/var/log")] == ["old", "new"]
+    assert calls == ["/var/log"]
+
+
+def test_upload_invalidates_listing_cache(client, counted_listing, tmp_path):
+    clock, calls = counted_listing
+    local = tmp_path / "report.txt"
+    local.write_text("data")
+    client.sftp = SimpleNamespace(put=lambda local_path, remote_path: None)
+    client._list_directory_sftp = client._list_directory_shell
+
+    client.list_directory("/var/log")
+    assert client.upload_file(str(local), "/var/log/report.txt")
+    client.list_directory("/var/log")
+
+    assert calls == ["/var/log", "/var/log"]